@@ -6,6 +6,14 @@
 # Description: Easy file transfer utility for iPhone and iPad devices on Linux
 
 import os
+import atexit
+import collections
+import contextlib
+import concurrent.futures
+import errno
+import functools
+import re
+import shlex
 import subprocess
 import shutil
 import sys
@@ -14,7 +22,10 @@ from tkinter import filedialog, messagebox, Button, Label, Listbox, Scrollbar, E
 import traceback
 import time
 import socket
+import sqlite3
 import platform
+import threading
+import queue
 
 # Application information
 APP_NAME = "PlugNPass"
@@ -22,7 +33,9 @@ APP_VERSION = "1.0.0"
 APP_DESCRIPTION = "iPhone File Transfer Utility for Linux"
 
 # Paths and configuration
-MOUNT_PATH = os.path.expanduser("~/iPhoneMount")
+# Resolved once so it compares equal to the path the kernel reports in the mount table
+MOUNT_PATH = os.path.realpath(os.path.expanduser("~/iPhoneMount"))
+_MOUNT_PREFIX = MOUNT_PATH.rstrip('/') + '/'  # For building paths in loops by concatenation
 CONFIG_DIR = os.path.expanduser("~/.config/plugnpass")
 DEBUG = False  # Disable debug output for normal use
 
@@ -31,6 +44,43 @@ CURRENT_MOUNT_TYPE = None  # None, "media", or "documents"
 CURRENT_APP_ID = None  # The app ID if in documents mode
 APP_LOCK_FILE = os.path.expanduser("~/.plugnpass.lock")
 LOG_FILE = os.path.join(CONFIG_DIR, "plugnpass.log")
+LOG_BATCH_SIZE = 256  # Most log lines appended to LOG_FILE per write
+_LOG_QUEUE = queue.Queue()  # Lines waiting for _log_writer()
+CACHE_DIR = os.path.expanduser("~/.cache/plugnpass")
+LISTING_DB = os.path.join(CACHE_DIR, "listings.db")  # Last listing per device, shown while relisting
+
+# Work finished on background threads, handed back to the Tk main loop
+UI_QUEUE_POLL_MS = 50
+STATUS_UPDATE_INTERVAL = 0.05  # Minimum seconds between progress messages from worker threads
+_UI_QUEUE = queue.Queue(maxsize=16)
+_LIST_GENERATION = 0  # Incremented on every list_files() call to drop stale results
+_LIST_IN_FLIGHT = False  # A listing worker is running
+_LIST_PENDING = False  # list_files() was called again while it ran
+_LISTED_ITEMS = []  # Python-side copy of the file list shown through file_list_var
+_LISTED_FILES = set()  # Relative paths in the current listing that are known regular files
+# Last complete listing, reused while the mount and its top-level directory are unchanged
+_LISTING_CACHE = {"key": None, "items": (), "note": "", "status": ""}
+DOCUMENTS_NOTE = "App Documents Folder: files saved here will be available in the app on your iPhone"
+MOUNT_POINT_BUSY = None  # Mount, unmount, reset or deep clean running on MOUNT_PATH, if any
+MOUNT_PROCESS = None  # Running ifuse process while a mount is in progress
+MOUNT_POLL_MS = 100
+UNMOUNT_TIMEOUT = 5  # Seconds to wait for fusermount before escalating
+
+# File copy tuning
+SENDFILE_CHUNK_SIZE = 8 * 1024 * 1024  # Bytes per os.copy_file_range()/os.sendfile() call
+COPY_BUFFER_SIZE = 1024 * 1024  # Buffer for copies that can't use sendfile
+LISTING_WORKERS = 4  # Directories read at once while listing; ifuse serializes some requests
+DOWNLOAD_WORKERS = 4  # Files copied at once in a multi-file download
+UPLOAD_READ_AHEAD = 4  # Chunks the upload reader may get ahead of the device writes
+_ACTIVE_TRANSFERS = set()  # Destination paths being written by a download or upload
+
+# Cached results of slow device queries
+APP_LIST_TTL = 60  # Seconds before the app list is fetched again
+_APP_LIST_CACHE = {"ts": 0, "apps": None}
+_DEVICE_UDID = None
+_UID_GID = f"{os.getuid()}:{os.getgid()}"  # Owner for a recreated mount point
+MOUNT_CACHE_TTL = 2  # Seconds a mount table lookup stays valid
+_MOUNT_CACHE = {"mounted_ts": 0.0, "mounted": None, "info_ts": 0.0, "info": None}
 
 # Ensure config directory exists
 os.makedirs(CONFIG_DIR, exist_ok=True)
@@ -40,22 +90,46 @@ def log_message(message, level="INFO"):
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"{timestamp} [{level}] {message}"
     
-    try:
-        with open(LOG_FILE, "a") as f:
-            f.write(log_line + "\n")
-    except Exception as e:
-        print(f"Error writing to log file: {e}")
+    # Written to the file by _log_writer(), so callers never wait on disk
+    _LOG_QUEUE.put(log_line + "\n")
         
     if DEBUG or level in ["ERROR", "WARNING"]:
         print(log_line)
 
+def _log_writer():
+    """Append queued log lines to LOG_FILE in batches (runs on its own daemon thread)"""
+    while True:
+        lines = [_LOG_QUEUE.get()]
+        while len(lines) < LOG_BATCH_SIZE:
+            try:
+                lines.append(_LOG_QUEUE.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with open(LOG_FILE, "a") as f:
+                f.write("".join(lines))
+        except Exception as e:
+            print(f"Error writing to log file: {e}")
+        finally:
+            for _ in lines:
+                _LOG_QUEUE.task_done()
+
+def flush_log():
+    """Wait until every queued log line has been written"""
+    _LOG_QUEUE.join()
+
+threading.Thread(target=_log_writer, daemon=True).start()
+# Daemon threads stop at exit, so write out what's left first
+atexit.register(flush_log)
+
 def debug_log(message):
     """Print debug message if DEBUG is enabled"""
     if DEBUG:
         log_message(message, "DEBUG")
 
+@functools.lru_cache(maxsize=1)
 def check_requirements():
-    """Check if all required tools are installed"""
+    """Check if all required tools are installed (cached for the session)"""
     requirements = {
         "ifuse": "ifuse command is required to mount iPhone. Install with: sudo apt install ifuse",
         "idevice_id": "idevice_id command is required to detect iPhone. Install with: sudo apt install libimobiledevice-utils",
@@ -64,50 +138,159 @@ def check_requirements():
     
     missing = []
     for cmd, msg in requirements.items():
-        try:
-            result = subprocess.run(["which", cmd], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            if result.returncode != 0:
-                missing.append(msg)
-        except Exception:
+        # shutil.which searches PATH in-process, no need to spawn `which`
+        if shutil.which(cmd) is None:
             missing.append(msg)
     
-    return missing
+    return tuple(missing)
 
 def get_device_udid():
-    """Get the UDID of the connected iPhone"""
+    """Get the UDID of the connected iPhone (cached until unmount or a failed mount)"""
+    global _DEVICE_UDID
+    if _DEVICE_UDID:
+        return _DEVICE_UDID
     try:
-        result = subprocess.run(["idevice_id", "-l"], capture_output=True, text=True)
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip().split('\n')[0]  # Return the first device if multiple are connected
-        return None
+        result = subprocess.run(["idevice_id", "-l"], capture_output=True)
+        # Use the first device if multiple are connected
+        udid = result.stdout.decode('utf-8', 'replace').lstrip().partition('\n')[0].strip() if result.returncode == 0 else ""
+        _DEVICE_UDID = udid or None
+        return _DEVICE_UDID
     except Exception as e:
         print(f"Error getting device UDID: {str(e)}")
         return None
 
+def invalidate_device_udid():
+    """Forget the cached UDID so the next mount looks up the device again"""
+    global _DEVICE_UDID
+    _DEVICE_UDID = None
+
+def invalidate_mount_cache():
+    """Forget cached mount state; call after anything that mounts or unmounts"""
+    _MOUNT_CACHE["mounted_ts"] = _MOUNT_CACHE["info_ts"] = 0.0
+    _MOUNT_CACHE["mounted"] = _MOUNT_CACHE["info"] = None
+
 def check_mount():
-    return os.path.ismount(MOUNT_PATH)
+    """Check if MOUNT_PATH is mounted, reusing the answer for MOUNT_CACHE_TTL seconds"""
+    now = time.monotonic()
+    if _MOUNT_CACHE["mounted"] is None or now - _MOUNT_CACHE["mounted_ts"] >= MOUNT_CACHE_TTL:
+        _MOUNT_CACHE["mounted"] = os.path.ismount(MOUNT_PATH)
+        _MOUNT_CACHE["mounted_ts"] = now
+    return _MOUNT_CACHE["mounted"]
 
-def update_status(text):
-    """Safely update status label"""
+def mount_point_is_clean():
+    """Check if the mount point is an empty directory with nothing mounted on it"""
     try:
-        if status_label.winfo_exists():
-            status_label.config(text=text)
+        if check_mount():
+            return False
+        # Stop at the first entry instead of reading the whole directory
+        with os.scandir(MOUNT_PATH) as entries:
+            return next(entries, None) is None
+    except OSError:
+        # Stale FUSE mounts fail with "Transport endpoint is not connected"
+        return False
+
+def mount_point_busy():
+    """Check whether a mount, unmount, reset or deep clean is still running
+    
+    These all change MOUNT_PATH, so only one may run at a time. Tells the
+    user which one is running.
+    """
+    if MOUNT_POINT_BUSY is None:
+        return False
+    debug_log(f"{MOUNT_POINT_BUSY} in progress, ignoring request")
+    messagebox.showinfo("Please Wait", f"{MOUNT_POINT_BUSY} is still in progress. Please try again when it finishes.")
+    return True
+
+def transfer_in_progress():
+    """Check whether a download or upload is still writing a file
+    
+    Unmounting under a running copy would cut it off and leave a truncated
+    file, so the mount point operations wait for it. Tells the user why.
+    """
+    if not _ACTIVE_TRANSFERS:
+        return False
+    debug_log(f"{len(_ACTIVE_TRANSFERS)} transfers in progress, ignoring request")
+    messagebox.showinfo("Please Wait", "A file transfer is still in progress. Please try again when it finishes.")
+    return True
+
+def set_mount_point_busy(operation):
+    """Record the operation now running on MOUNT_PATH, or None once it is done"""
+    global MOUNT_POINT_BUSY
+    MOUNT_POINT_BUSY = operation
+
+def update_status(text, flush=True):
+    """Safely update status label
+    
+    Args:
+        text: The new status text
+        flush: Redraw immediately; only needed before blocking work. Callbacks
+               already running in the event loop pass False and let Tk redraw
+               when it goes idle.
+    """
+    try:
+        # Setting the label's text variable is a single Tcl call
+        status_var.set(text)
+        if flush:
             root.update_idletasks()
     except Exception as e:
         print(f"Error updating status: {e}")
 
+def invalidate_app_list_cache():
+    """Forget the cached app list so the next lookup queries the device again"""
+    _APP_LIST_CACHE["ts"] = 0
+    _APP_LIST_CACHE["apps"] = None
+
+def call_in_ui(func, *args):
+    """Schedule func(*args) on the Tk main thread (safe to call from worker threads)"""
+    _UI_QUEUE.put((func, args))
+
+def run_in_background(work, on_done):
+    """Run work() on a daemon thread, then call on_done(result, error) on the Tk main thread"""
+    def runner():
+        try:
+            result, error = work(), None
+        except Exception as e:
+            debug_log(traceback.format_exc())
+            result, error = None, e
+        call_in_ui(on_done, result, error)
+    threading.Thread(target=runner, daemon=True).start()
+
+def drain_ui_queue():
+    """Run callbacks queued by worker threads, then poll again"""
+    try:
+        while True:
+            func, args = _UI_QUEUE.get_nowait()
+            try:
+                func(*args)
+            except Exception as e:
+                debug_log(f"Error in UI callback {getattr(func, '__name__', func)}: {e}")
+                debug_log(traceback.format_exc())
+    except queue.Empty:
+        pass
+    root.after(UI_QUEUE_POLL_MS, drain_ui_queue)
+
 def get_app_list():
-    """Get list of iOS apps that support file sharing"""
+    """Get list of iOS apps that support file sharing
+    
+    The result is cached for APP_LIST_TTL seconds since ifuse --list-apps
+    has to handshake with the device every time it runs.
+    """
+    if _APP_LIST_CACHE["apps"] is not None and time.time() - _APP_LIST_CACHE["ts"] < APP_LIST_TTL:
+        debug_log("Using cached app list")
+        return _APP_LIST_CACHE["apps"]
+        
     try:
         debug_log("Fetching app list...")
-        result = subprocess.run(["ifuse", "--list-apps"], capture_output=True, text=True)
+        result = subprocess.run(["ifuse", "--list-apps"], capture_output=True)
+        # Decode once here rather than through a text-mode pipe wrapper
+        output = result.stdout.decode('utf-8', 'replace')
         debug_log(f"ifuse --list-apps exit code: {result.returncode}")
-        debug_log(f"ifuse --list-apps stdout: {result.stdout}")
-        debug_log(f"ifuse --list-apps stderr: {result.stderr}")
+        debug_log(f"ifuse --list-apps stdout: {output}")
+        debug_log(f"ifuse --list-apps stderr: {result.stderr.decode('utf-8', 'replace')}")
         
         apps = []
         if result.returncode == 0:
-            for line in result.stdout.strip().split('\n'):
+            for line in output.strip().split('\n'):
                 debug_log(f"Processing app line: {line}")
                 if not line.strip():
                     continue
@@ -124,6 +307,9 @@ def get_app_list():
                     debug_log(f"Skipping invalid app line: {line}")
                     
         debug_log(f"Total apps found: {len(apps)}")
+        if result.returncode == 0:
+            _APP_LIST_CACHE["apps"] = apps
+            _APP_LIST_CACHE["ts"] = time.time()
         return apps
     except Exception as e:
         debug_log(f"Error getting app list: {str(e)}")
@@ -229,15 +415,27 @@ def reset_mount_point():
     debug_log(f"Resetting mount point directory: {MOUNT_PATH}")
     success = False
     
-    # First unmount if mounted
+    # First unmount if mounted, escalating only while the mount is still there
     try:
         debug_log("Forcibly unmounting")
-        # Try standard unmount first
-        subprocess.run(["fusermount", "-u", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        # Then try with -z force option
-        subprocess.run(["fusermount", "-uz", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+        # Try standard unmount first, then with -z force option. A wedged
+        # FUSE mount can make fusermount hang, so don't wait on it forever.
+        for cmd in (["fusermount", "-u", MOUNT_PATH], ["fusermount", "-uz", MOUNT_PATH]):
+            try:
+                result = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        timeout=UNMOUNT_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                debug_log(f"{' '.join(cmd)} timed out after {UNMOUNT_TIMEOUT}s")
+                continue
+            finally:
+                invalidate_mount_cache()
+            if result.returncode == 0 and not check_mount():
+                break
         # Then try with sudo as a last resort
-        subprocess.run(["sudo", "umount", "-f", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+        if check_mount():
+            debug_log("fusermount failed, trying sudo umount")
+            subprocess.run(["sudo", "umount", "-f", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+            invalidate_mount_cache()
     except Exception as e:
         debug_log(f"Unmount error (non-fatal): {e}")
     
@@ -250,11 +448,7 @@ def reset_mount_point():
                 debug_log("Removing directory with shutil.rmtree")
                 shutil.rmtree(MOUNT_PATH, ignore_errors=True)
             
-            # Try with command line as fallback
-            debug_log("Removing directory with rm command")
-            subprocess.run(["rm", "-rf", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-            
-            # One more check
+            # Only fall back to sudo if rmtree couldn't remove it
             if os.path.exists(MOUNT_PATH):
                 debug_log("Directory still exists, trying with sudo")
                 subprocess.run(["sudo", "rm", "-rf", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
@@ -264,7 +458,6 @@ def reset_mount_point():
     # Create a fresh directory
     try:
         debug_log("Creating fresh mount directory")
-        # Try direct OS creation
         os.makedirs(MOUNT_PATH, exist_ok=True)
         
         # Check if directory was created successfully
@@ -273,11 +466,6 @@ def reset_mount_point():
             debug_log("Setting permissions on mount directory")
             os.chmod(MOUNT_PATH, 0o755)  # rwxr-xr-x
             success = True
-        else:
-            # Try with command line
-            debug_log("Directory not created, trying with mkdir command")
-            subprocess.run(["mkdir", "-p", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-            success = os.path.exists(MOUNT_PATH)
     except Exception as e:
         debug_log(f"Failed to create mount point directory: {e}")
         success = False
@@ -294,12 +482,18 @@ def mount_iphone(documents_mode=False):
     global CURRENT_MOUNT_TYPE, CURRENT_APP_ID
     debug_log(f"mount_iphone called with documents_mode={documents_mode}")
     
+    if mount_point_busy():
+        return
+        
+    # The mount may have changed outside the app since we last looked
+    invalidate_mount_cache()
+    
     # First ensure the mount point is clean
     if os.path.exists(MOUNT_PATH):
         if check_mount():
             debug_log("iPhone already mounted")
             messagebox.showinfo("Already Mounted", "iPhone is already mounted.")
-            list_files()
+            list_files(mounted=True)
             return
         # Directory exists but not mounted - we can proceed
         debug_log(f"Mount path exists but not mounted: {MOUNT_PATH}")
@@ -315,9 +509,12 @@ def mount_iphone(documents_mode=False):
                 return
 
     try:
-        # First unmount if any stale mount exists
-        debug_log("Attempting to unmount any stale mount")
-        subprocess.run(["fusermount", "-u", MOUNT_PATH], stderr=subprocess.PIPE)
+        # First unmount if any stale mount exists; an empty, unmounted
+        # directory has nothing to unmount
+        if not mount_point_is_clean():
+            debug_log("Attempting to unmount any stale mount")
+            subprocess.run(["fusermount", "-u", MOUNT_PATH], stderr=subprocess.PIPE)
+            invalidate_mount_cache()
         
         # Reset mount type tracking
         CURRENT_MOUNT_TYPE = None
@@ -326,11 +523,12 @@ def mount_iphone(documents_mode=False):
         # Try to clean up non-empty mount point by removing any files
         try:
             debug_log("Cleaning mount point directory")
-            for item in os.listdir(MOUNT_PATH):
-                item_path = os.path.join(MOUNT_PATH, item)
-                if os.path.isfile(item_path):
-                    debug_log(f"Removing file: {item_path}")
-                    os.remove(item_path)
+            # DirEntry.is_file() uses the type from readdir, no extra stat per entry
+            with os.scandir(MOUNT_PATH) as entries:
+                for entry in entries:
+                    if entry.is_file(follow_symlinks=False):
+                        debug_log(f"Removing file: {entry.path}")
+                        os.remove(entry.path)
         except Exception as e:
             # Just log, don't stop the process
             debug_log(f"Warning: Could not clean mount directory: {e}")
@@ -378,60 +576,113 @@ def mount_iphone(documents_mode=False):
         command.append(MOUNT_PATH)
         
         debug_log(f"Running mount command: {' '.join(command)}")
-        # Update UI before running the mount command
-        root.update_idletasks()
+        start_mount(command, documents_mode, app_id if documents_mode else None)
+    except Exception as e:
+        debug_log(f"Exception during mount: {str(e)}")
+        debug_log(traceback.format_exc())
+        messagebox.showerror("Error", f"Mount error: {str(e)}")
+        update_status(f"Status: Error - {str(e)[:30]}...")
+
+def start_mount(command, documents_mode, app_id):
+    """Start the ifuse command without blocking and poll it from the Tk main loop"""
+    global MOUNT_PROCESS
+    MOUNT_PROCESS = subprocess.Popen(command, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    # Only once ifuse is actually running; if Popen raises, later mounts must not be blocked
+    set_mount_point_busy("Mount")
+    # A remount can reuse st_dev and the root's mtime, so never carry a listing across mounts
+    invalidate_listing_cache()
+    status_text = f"Status: Mounting documents for app {app_id}" if documents_mode else "Status: Mounting media (mostly read-only)"
+    root.after(MOUNT_POLL_MS, poll_mount, MOUNT_PROCESS, status_text, 0, documents_mode, app_id)
+
+def poll_mount(process, status_text, ticks, documents_mode, app_id):
+    """Animate the status line until ifuse exits, then hand over to finish_mount()"""
+    global MOUNT_PROCESS
+    if process.poll() is None:
+        update_status(status_text + "." * (ticks % 4), flush=False)
+        root.after(MOUNT_POLL_MS, poll_mount, process, status_text, ticks + 1, documents_mode, app_id)
+        return
         
-        result = subprocess.run(command, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+    MOUNT_PROCESS = None
+    invalidate_mount_cache()
+    try:
+        stdout, stderr = process.communicate()
+        result = subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
         debug_log(f"Mount command exit code: {result.returncode}")
         debug_log(f"Mount command stdout: {result.stdout}")
         debug_log(f"Mount command stderr: {result.stderr}")
-        
-        if check_mount():
-            debug_log("Mount successful, updating UI")
-            if documents_mode:
-                # Set the mount type
-                CURRENT_MOUNT_TYPE = "documents"
-                messagebox.showinfo("Mounted", f"App documents folder mounted successfully.\n\nYou can now upload files to this app.")
-                update_status(f"Status: App '{app_id}' documents mounted (read-write)")
-            else:
-                # Set the mount type
-                CURRENT_MOUNT_TYPE = "media"
-                messagebox.showinfo("Mounted", "iPhone media mounted successfully (mostly read-only).")
-                update_status("Status: iPhone media mounted (read-only)")
-            list_files()
-        else:
-            debug_log("Mount failed, checking error messages")
-            error = result.stderr.decode('utf-8') if result.stderr else "Unknown error"
-            if "No device found" in error:
-                debug_log("No device found error")
-                messagebox.showerror("Error", "No iPhone device found. Please make sure it's connected and unlocked.")
-                update_status("Status: No device found")
-            elif "Permission denied" in error:
-                debug_log("Permission denied error")
-                messagebox.showerror("Error", "Permission denied when mounting iPhone.\n\nTry running the app with sudo or as root.")
-                update_status("Status: Permission denied mounting iPhone")
-            else:
-                debug_log(f"Other mount error: {error}")
-                messagebox.showerror("Error", f"Failed to mount iPhone: {error}")
-                update_status(f"Status: Mount error - {error[:30]}...")
+        finish_mount((result, check_mount()), None, documents_mode, app_id)
     except Exception as e:
-        debug_log(f"Exception during mount: {str(e)}")
         debug_log(traceback.format_exc())
-        messagebox.showerror("Error", f"Mount error: {str(e)}")
-        update_status(f"Status: Error - {str(e)[:30]}...")
+        finish_mount(None, e, documents_mode, app_id)
+
+def finish_mount(outcome, error, documents_mode, app_id):
+    """Report the result of start_mount() (runs on the Tk main thread)"""
+    global CURRENT_MOUNT_TYPE
+    set_mount_point_busy(None)
+    invalidate_listing_cache()
+    
+    if error is not None:
+        debug_log(f"Exception during mount: {str(error)}")
+        messagebox.showerror("Error", f"Mount error: {str(error)}")
+        update_status(f"Status: Error - {str(error)[:30]}...")
+        return
+        
+    result, mounted = outcome
+    if mounted:
+        debug_log("Mount successful, updating UI")
+        if documents_mode:
+            # Set the mount type
+            CURRENT_MOUNT_TYPE = "documents"
+            messagebox.showinfo("Mounted", f"App documents folder mounted successfully.\n\nYou can now upload files to this app.")
+            update_status(f"Status: App '{app_id}' documents mounted (read-write)")
+        else:
+            # Set the mount type
+            CURRENT_MOUNT_TYPE = "media"
+            messagebox.showinfo("Mounted", "iPhone media mounted successfully (mostly read-only).")
+            update_status("Status: iPhone media mounted (read-only)")
+        list_files(mounted=True)
+    else:
+        debug_log("Mount failed, checking error messages")
+        # The cached UDID may belong to a device that is gone
+        invalidate_device_udid()
+        error = result.stderr.decode('utf-8') if result.stderr else "Unknown error"
+        if "No device found" in error:
+            debug_log("No device found error")
+            messagebox.showerror("Error", "No iPhone device found. Please make sure it's connected and unlocked.")
+            update_status("Status: No device found")
+        elif "Permission denied" in error:
+            debug_log("Permission denied error")
+            messagebox.showerror("Error", "Permission denied when mounting iPhone.\n\nTry running the app with sudo or as root.")
+            update_status("Status: Permission denied mounting iPhone")
+        else:
+            debug_log(f"Other mount error: {error}")
+            messagebox.showerror("Error", f"Failed to mount iPhone: {error}")
+            update_status(f"Status: Mount error - {error[:30]}...")
 
 def mount_iphone_documents():
     """Mount documents folder of a selected app (allows file transfers)"""
     mount_iphone(documents_mode=True)
 
 def unmount_iphone():
-    global CURRENT_MOUNT_TYPE, CURRENT_APP_ID
+    if mount_point_busy() or transfer_in_progress():
+        return
+    invalidate_mount_cache()
     if not check_mount():
         messagebox.showinfo("Not Mounted", "iPhone is not currently mounted.")
         return
         
+    set_mount_point_busy("Unmount")
+    update_status("Status: Unmounting...")
+    # fusermount can take a while on a busy or wedged mount; keep the window responsive
+    run_in_background(_do_unmount, _finish_unmount)
+
+def _do_unmount():
+    """Run fusermount on MOUNT_PATH (runs on a worker thread)
+    
+    Returns:
+        str: fusermount's error output if the mount is still there, else None
+    """
     try:
-        update_status("Status: Unmounting...")
         result = subprocess.run(["fusermount", "-u", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
         debug_log(f"Unmount exit code: {result.returncode}")
         
@@ -439,343 +690,274 @@ def unmount_iphone():
             debug_log(f"Standard unmount failed, trying force unmount")
             # Try more aggressive unmounting
             subprocess.run(["fusermount", "-uz", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-        
-        if not check_mount():
+    finally:
+        invalidate_mount_cache()
+    
+    if not check_mount():
+        return None
+    return result.stderr.decode('utf-8') if result.stderr else "Unknown error"
+
+def _finish_unmount(error_output, error):
+    """Report the result of _do_unmount() and reset state (runs on the Tk main thread)"""
+    global CURRENT_MOUNT_TYPE, CURRENT_APP_ID
+    set_mount_point_busy(None)
+    try:
+        if error is not None:
+            debug_log(f"Unmount error: {str(error)}")
+            messagebox.showerror("Error", f"Unmount error: {str(error)}")
+            update_status(f"Status: Error - {str(error)[:30]}...")
+        elif error_output is None:
             messagebox.showinfo("Unmounted", "iPhone unmounted successfully.")
             update_status("Status: iPhone unmounted successfully")
             # Clear the file list
-            file_list.delete(0, END)
+            cancel_listing()
+            _LISTED_ITEMS.clear()
+            _LISTED_FILES.clear()
+            _show_listed_items()
+            set_list_note("")
             # Reset mount type tracking
             CURRENT_MOUNT_TYPE = None
             CURRENT_APP_ID = None
+            # The device may be swapped before the next mount
+            invalidate_listing_cache()
+            invalidate_app_list_cache()
+            invalidate_device_udid()
         else:
             # If still mounted, provide more detailed error
-            error_output = result.stderr.decode('utf-8') if result.stderr else "Unknown error"
             debug_log(f"Failed to unmount. Error: {error_output}")
             messagebox.showerror("Error", f"Failed to unmount iPhone: {error_output}\n\nTry the 'Deep Clean Mount' option.")
             update_status("Status: Unmount failed")
-    except Exception as e:
-        debug_log(f"Unmount error: {str(e)}")
-        messagebox.showerror("Error", f"Unmount error: {str(e)}")
-        update_status(f"Status: Error - {str(e)[:30]}...")
+    except tk.TclError:
+        # Widget destroyed
+        return
 
-def is_system_file(filename):
-    """Check if a file is a system file that should be hidden from users
+# System file extensions to hide in media mode
+SYSTEM_EXTENSIONS = (
+    '.lock',        # Lock files
+    '.DS_Store',    # macOS metadata
+    '.ithmb',       # iOS thumbnail images
+    '.plist',       # Property list files
+    '.albummetadata', # Album metadata
+    '.memorymetadata', # Memory metadata
+    '.facemetadata',  # Face recognition metadata
+    '.log',         # Log files
+    '.sqlite',      # SQLite database files
+    '.sqlitedb',    # SQLite database files
+    '.sqlite-shm',  # SQLite shared memory files
+    '.sqlite-wal',  # SQLite write-ahead log
+    '.db',          # Database files
+    '.dat',         # Data files
+    '.tmp',         # Temporary files
+    '.pb',          # iOS property list backups
+    '.cache',       # Cache files
+    '.ptl',         # iOS portal files
+    '.crashreport', # Crash reports
+    '.btree',       # B-tree index files
+    '.strings',     # String resource files
+    '.itc',         # iTunes cache files
+    '.itdb',        # iTunes database files
+    '.itl',         # iTunes library files
+    '.bak',         # Backup files
+    '.mdbackup',    # Mobile device backup files
+    '.mddata',      # Mobile device data files
+    '.thumb',       # Thumbnail files
+    '.journal',     # Journal files
+    '.synctoken',   # Sync token files
+    '.artwork',     # Artwork cache files
+    '.bat',         # Batch files
+)
 
-    Args:
-        filename: The name of the file to check
+# System file name fragments, matched anywhere in the relative path
+SYSTEM_NAME_PATTERNS = (
+    'Thumbs.db',    # Windows thumbnail cache
+    'thumbs',       # Generic thumbnail files
+    'iTunesMetadata', # iTunes metadata
+    'iTunesArtwork', # iTunes artwork
+    'iTunesPrefs',  # iTunes preferences
+    'iTunesTouch',  # iTunes touch data
+    'iTunesSync',   # iTunes sync data
+    'CoverFlow',    # Cover flow cache
+    'Manifest.',    # Manifest files
+    'SyncData',     # Sync data
+    'Recordings',   # Voice recordings metadata
+    'PhotoData',    # Photo data
+    '.config',      # Configuration files
+    
+    # Apple system files
+    '.Trashes',     # iOS trash
+    '__MACOSX',     # macOS resource fork
+    '.fseventsd',   # iOS filesystem events
+    '.metadata_',   # Generic metadata
+    '.com.apple',   # Apple system files
+    '._',           # macOS resource forks
+    '.DocumentRevisions-',  # Document revisions
+    'DCIM/.MISC',   # Camera misc data
+)
 
-    Returns:
-        bool: True if the file should be hidden, False otherwise
-    """
-    # System files and metadata files to ignore
-    system_patterns = [
-        # File extensions
-        '.lock',        # Lock files
-        '.DS_Store',    # macOS metadata
-        '.ithmb',       # iOS thumbnail images
-        '.plist',       # Property list files
-        '.albummetadata', # Album metadata
-        '.memorymetadata', # Memory metadata
-        '.facemetadata',  # Face recognition metadata
-        '.log',         # Log files
-        '.sqlite',      # SQLite database files
-        '.sqlitedb',    # SQLite database files
-        '.sqlite-shm',  # SQLite shared memory files
-        '.sqlite-wal',  # SQLite write-ahead log
-        '.db',          # Database files
-        '.dat',         # Data files
-        '.tmp',         # Temporary files
-        '.pb',          # iOS property list backups
-        '.cache',       # Cache files
-        '.ptl',         # iOS portal files
-        '.crashreport', # Crash reports
-        '.btree',       # B-tree index files
-        '.strings',     # String resource files
-        '.itc',         # iTunes cache files
-        '.itdb',        # iTunes database files
-        '.itl',         # iTunes library files
-        '.bak',         # Backup files
-        '.mdbackup',    # Mobile device backup files
-        '.mddata',      # Mobile device data files
-        '.thumb',       # Thumbnail files
-        '.journal',     # Journal files
-        '.synctoken',   # Sync token files
-        '.artwork',     # Artwork cache files
-        '.bat',         # Batch files
-        
-        # File name patterns
-        'Thumbs.db',    # Windows thumbnail cache
-        'thumbs',       # Generic thumbnail files
-        'iTunesMetadata', # iTunes metadata
-        'iTunesArtwork', # iTunes artwork
-        'iTunesPrefs',  # iTunes preferences
-        'iTunesTouch',  # iTunes touch data
-        'iTunesSync',   # iTunes sync data
-        'CoverFlow',    # Cover flow cache
-        'Manifest.',    # Manifest files
-        'SyncData',     # Sync data
-        'Recordings',   # Voice recordings metadata
-        'PhotoData',    # Photo data
-        '.config',      # Configuration files
-        
-        # Apple system files
-        '.Trashes',     # iOS trash
-        '__MACOSX',     # macOS resource fork
-        '.fseventsd',   # iOS filesystem events
-        '.metadata_',   # Generic metadata
-        '.com.apple',   # Apple system files
-        '._',           # macOS resource forks
-        '.DocumentRevisions-',  # Document revisions
-        'DCIM/.MISC',   # Camera misc data
-    ]
-    
-    # Directories to completely ignore
-    system_directories = [
-        # Photo and media related directories
-        'PhotoData/Catches',
-        'PhotoData/AlbumsMetadata',
-        'PhotoData/Mutations',
-        'PhotoData/Sync',
-        'PhotoData/Thumbnails',
-        'PhotoData/Videos',
-        'PhotoData/CPLAssets',
-        'PhotoData/Metadata',
-        'MediaAnalysis',
-        'MotionAssets'
-        
-        # System directories
-        'iTunes_Control/',
-        'iTunes-control',
-        'iTunesControl',
-        'Books/',
-        'Podcasts/',
-        'Recordings/',
-        'Purchases/',
-        
-        # Cache and metadata directories
-        '.Spotlight-V100',
-        '.DocumentRevisions-V100',
-        '.TemporaryItems',
-        '.Trashes',
-        '.fseventsd',
-        '.Trash',
-        '.com.apple',
-        
-        # System folders
-        'DCIM/.MISC',
-        'DCIM/.thumbnails',
-        'DCIM/.TRACES',
-        'DCIM/.MISC',
-        'System/',
-        'private/var/mobile/Library/Caches',
-        'private/var/mobile/Library/Logs',
-        'private/var/mobile/Library/Preferences',
-        'private/var/root',
-        'private/var/Keychains',
-        'private/var/stash',
-        'private/etc',
-        'private/tmp',
-        
-        # Device firmware and backup
-        'System/Library',
-        'System/Library/Lockdown',
-        'System/Library/Caches',
-        'System/Library/LaunchDaemons',
-        'private/var/MobileDevice',
-        'private/var/MobileDevice/ProvisioningProfiles',
-        'private/var/containers',
-        'private/var/db',
-        'private/var/keybags'
-    ]
-    
-    # Check if the filename is in or starts with any system directory
-    for directory in system_directories:
-        normalized_dir = directory.rstrip('/')  # Handle trailing slash variations
-        if filename.startswith(normalized_dir + '/') or filename == normalized_dir:
-            return True
-    
-    # Check if the filename matches any of the system patterns
-    for pattern in system_patterns:
-        if pattern in filename:
-            return True
-    
-    # Check if the filename starts with a dot (hidden files)
-    if os.path.basename(filename).startswith('.'):
+# Directories to completely ignore
+SYSTEM_DIRECTORIES = (
+    # Photo and media related directories
+    'PhotoData/Catches',
+    'PhotoData/AlbumsMetadata',
+    'PhotoData/Mutations',
+    'PhotoData/Sync',
+    'PhotoData/Thumbnails',
+    'PhotoData/Videos',
+    'PhotoData/CPLAssets',
+    'PhotoData/Metadata',
+    'MediaAnalysis',
+    'MotionAssets',
+    
+    # System directories
+    'iTunes_Control/',
+    'iTunes-control',
+    'iTunesControl',
+    'Books/',
+    'Podcasts/',
+    'Recordings/',
+    'Purchases/',
+    
+    # Cache and metadata directories
+    '.Spotlight-V100',
+    '.DocumentRevisions-V100',
+    '.TemporaryItems',
+    '.Trashes',
+    '.fseventsd',
+    '.Trash',
+    '.com.apple',
+    
+    # System folders
+    'DCIM/.MISC',
+    'DCIM/.thumbnails',
+    'DCIM/.TRACES',
+    'System/',
+    'private/var/mobile/Library/Caches',
+    'private/var/mobile/Library/Logs',
+    'private/var/mobile/Library/Preferences',
+    'private/var/root',
+    'private/var/Keychains',
+    'private/var/stash',
+    'private/etc',
+    'private/tmp',
+    
+    # Device firmware and backup
+    'System/Library',
+    'System/Library/Lockdown',
+    'System/Library/Caches',
+    'System/Library/LaunchDaemons',
+    'private/var/MobileDevice',
+    'private/var/MobileDevice/ProvisioningProfiles',
+    'private/var/containers',
+    'private/var/db',
+    'private/var/keybags'
+)
+
+# Extensions of ordinary user files, accepted by _is_system_basename() without further checks
+_COMMON_MEDIA_EXTS = frozenset({
+    '.jpg', '.jpeg', '.heic', '.heif', '.png', '.gif',
+    '.mov', '.mp4', '.m4v', '.m4a', '.mp3', '.aac',
+    '.pdf', '.txt', '.doc', '.docx', '.zip',
+})
+
+# Precompiled lookups for the system file filters, which run once per listed file or directory.
+# Duplicates are dropped and entries sorted once here, not on every call.
+_SYSTEM_EXTS = frozenset(SYSTEM_EXTENSIONS)
+# Hidden names and system extensions in one pattern, matched against a basename
+_SYSTEM_BASENAME_RE = re.compile(r'^\.|(?:%s)$' % '|'.join(re.escape(ext) for ext in sorted(_SYSTEM_EXTS)))
+_SYSTEM_DIR_PREFIXES = tuple(sorted(set(directory.rstrip('/') for directory in SYSTEM_DIRECTORIES)))
+_SYSTEM_DIR_PREFIXES_SLASH = tuple(prefix + '/' for prefix in _SYSTEM_DIR_PREFIXES)
+_SYSTEM_NAME_PATTERNS = tuple(sorted(set(SYSTEM_NAME_PATTERNS)))
+_SYSTEM_NAME_RE = re.compile('|'.join(re.escape(pattern) for pattern in _SYSTEM_NAME_PATTERNS))
+
+def _build_find_prune_args():
+    """Build the find(1) expression that prunes system directories below MOUNT_PATH"""
+    tests = []
+    for prefix in _SYSTEM_DIR_PREFIXES:
+        tests += ["-o", "-path", os.path.join(MOUNT_PATH, prefix)]
+    for pattern in _SYSTEM_NAME_PATTERNS:
+        tests += ["-o", "-path", f"{MOUNT_PATH}/*{pattern}*"]
+    return ["(", "-type", "d", "("] + tests[1:] + [")", ")", "-prune", "-o"]
+
+_FIND_PRUNE_ARGS = _build_find_prune_args()
+
+def _in_system_directory(rel_dir):
+    """Check if a directory (relative to the mount point) is or is inside one of SYSTEM_DIRECTORIES"""
+    return rel_dir in _SYSTEM_DIR_PREFIXES or rel_dir.startswith(_SYSTEM_DIR_PREFIXES_SLASH)
+
+def _is_system_dir(rel_dir):
+    """Check if a directory (relative to the mount point) should be skipped entirely in media mode"""
+    if _in_system_directory(rel_dir):
         return True
-        
-    return False
+    return _SYSTEM_NAME_RE.search(rel_dir) is not None
+
+def _is_system_basename(name):
+    """Check only the file name itself, for files whose directory already passed _is_system_dir()"""
+    if _SYSTEM_BASENAME_RE.search(name):
+        return True
+    # Most files on a device are photos, videos and documents; accept those
+    # without running the name pattern regex
+    if os.path.splitext(name)[1].lower() in _COMMON_MEDIA_EXTS:
+        return False
+    return _SYSTEM_NAME_RE.search(name) is not None
 
-def list_files():
+def list_files(mounted=None):
+    """Refresh the file list from the mount point
+    
+    The directory walk runs on a worker thread; batches of names are handed
+    back to the main loop through call_in_ui().
+    
+    Calls made while a walk is still running (a double-clicked Refresh, an
+    upload finishing mid-listing) stop that walk and are coalesced into one
+    new listing once it has wound down.
+    
+    Args:
+        mounted: Pass True when the caller has just verified the mount,
+                 to skip checking it again
+    """
+    global _LIST_GENERATION, _LIST_IN_FLIGHT, _LIST_PENDING
+    if _LIST_IN_FLIGHT:
+        debug_log("Listing already running, relisting when it stops")
+        _LIST_PENDING = True
+        # Tell the running walk to stop at its next batch
+        _LIST_GENERATION += 1
+        return
     try:
-        file_list.delete(0, END)
-        if check_mount():
+        _LISTED_ITEMS.clear()
+        _LISTED_FILES.clear()
+        _show_listed_items()
+        set_list_note("")
+        if mounted or check_mount():
             try:
                 update_status("Status: Listing files...")
                 
-                file_count = 0
-                skipped_count = 0
-                batch_size = 100  # Process files in batches for better UI responsiveness
-                current_batch = []
-                max_files = 5000  # Limit max files to show for performance
-                reached_limit = False
-                
-                # Add a header if we're in documents mode
-                current_mount_type = get_mount_type()
-                if current_mount_type and "documents" in current_mount_type:
-                    # Add a special informational header
-                    file_list.insert(END, "--- App Documents Folder ---")
-                    file_list.insert(END, "Files saved here will be available in the app on your iPhone")
-                    file_list.insert(END, "")
-                
-                # Define system directories to skip directly in this function
-                system_dirs_to_skip = [
-                    # Photo and media related directories
-                    'PhotoData/Catches',
-                    'PhotoData/AlbumsMetadata',
-                    'PhotoData/Mutations',
-                    'PhotoData/Sync',
-                    'PhotoData/Thumbnails',
-                    'PhotoData/Videos',
-                    'PhotoData/CPLAssets',
-                    'PhotoData/Metadata',
-                    'MediaAnalysis',
-                    'MotionAssets',
-                    
-                    # System directories
-                    'iTunes_Control/',
-                    'iTunes-control',
-                    'iTunesControl',
-                    'Books/',
-                    'Podcasts/',
-                    'Recordings/',
-                    'Purchases/',
-                    
-                    # Cache and metadata directories
-                    '.Spotlight-V100',
-                    '.DocumentRevisions-V100',
-                    '.TemporaryItems',
-                    '.Trashes',
-                    '.fseventsd',
-                    '.Trash',
-                    '.com.apple',
-                    
-                    # System folders
-                    'DCIM/.MISC',
-                    'DCIM/.thumbnails',
-                    'DCIM/.TRACES',
-                    'DCIM/.MISC',
-                    'System/',
-                    'private/var/mobile/Library/Caches',
-                    'private/var/mobile/Library/Logs',
-                    'private/var/mobile/Library/Preferences',
-                    'private/var/root',
-                    'private/var/Keychains',
-                    'private/var/stash',
-                    'private/etc',
-                    'private/tmp'
-                ]
-                
-                # Normalize the directory paths
-                normalized_dirs = []
-                for directory in system_dirs_to_skip:
-                    normalized_dirs.append(directory.rstrip('/'))
-                
-                # More efficient walking with early directory skipping
-                remaining_files = []
-                
-                for root_dir, dirs, files in os.walk(MOUNT_PATH):
-                    try:
-                        # Skip unwanted directories early
-                        rel_root = os.path.relpath(root_dir, MOUNT_PATH)
-                        if rel_root != '.' and any(rel_root == skip_dir or rel_root.startswith(skip_dir + '/') for skip_dir in normalized_dirs):
-                            # Remove all subdirs to prevent further walking into this branch
-                            dirs.clear()
-                            continue
-                        
-                        # Filter directories list in-place to skip system folders
-                        i = 0
-                        while i < len(dirs):
-                            dir_path = os.path.join(rel_root, dirs[i]) if rel_root != '.' else dirs[i]
-                            # Skip system directories
-                            if CURRENT_MOUNT_TYPE == "media" and any(dir_path == skip_dir or dir_path.startswith(skip_dir + '/') for skip_dir in normalized_dirs):
-                                dirs.pop(i)  # Remove this directory from walk
-                            else:
-                                i += 1
-                                
-                        for f in files:
-                            if not file_list.winfo_exists():
-                                return  # Widget destroyed
-                            
-                            full_path = os.path.join(root_dir, f)
-                            relative_path = os.path.relpath(full_path, MOUNT_PATH)
-                            
-                            # Skip system files in media mode (faster check with less string operations)
-                            if CURRENT_MOUNT_TYPE == "media":
-                                # Fast check for common file extensions and patterns first
-                                basename = os.path.basename(relative_path)
-                                if basename.startswith('.') or '.cache' in relative_path or '.plist' in relative_path:
-                                    skipped_count += 1
-                                    continue
-                                
-                                # Then do full check only if needed
-                                if is_system_file(relative_path):
-                                    skipped_count += 1
-                                    continue
-                            
-                            # Add to current batch
-                            current_batch.append(relative_path)
-                            file_count += 1
-                            
-                            # Process batch
-                            if len(current_batch) >= batch_size:
-                                # Check if we've hit the file limit
-                                if file_count > max_files:
-                                    reached_limit = True
-                                    remaining_files = current_batch
-                                    break
-                                    
-                                # Update UI with this batch
-                                for item in current_batch:
-                                    file_list.insert(END, item)
-                                
-                                # Clear batch and update UI
-                                current_batch = []
-                                update_status(f"Status: Listed {file_count} files...")
-                                root.update_idletasks()
-                        
-                        # If we've hit the limit, stop walking
-                        if reached_limit:
-                            break
-                            
-                    except Exception as e:
-                        debug_log(f"Error processing directory {root_dir}: {e}")
-                        continue  # Continue with next directory
-                
-                # Add any remaining files in the last batch
-                for item in current_batch:
-                    if len(remaining_files) < max_files:
-                        file_list.insert(END, item)
+                # Add a header if we're in documents mode, using the tracked
+                # mount type and only falling back to the mount table if unknown
+                if CURRENT_MOUNT_TYPE:
+                    documents_mode = CURRENT_MOUNT_TYPE == "documents"
+                else:
+                    documents_mode = is_documents_mount()
+                if documents_mode:
+                    set_list_note(DOCUMENTS_NOTE)
                 
-                # Add instructions if empty folder            
-                if file_count == 0 and current_mount_type and "documents" in current_mount_type:
-                    file_list.insert(END, "This folder is empty.")
-                    file_list.insert(END, "Use the 'Upload File to iPhone' button to upload files.")
+                # Any listing still running from an earlier call becomes stale
+                _LIST_GENERATION += 1
                 
-                # Show message if we hit the display limit
-                if reached_limit:
-                    file_list.insert(END, "")
-                    file_list.insert(END, f"--- Only showing {max_files} of {file_count + skipped_count} files ---")
-                    file_list.insert(END, "Use the search feature to find specific files")
+                # Walking a FUSE mount is slow, so reuse the last listing if nothing changed
+                cache_key = _listing_cache_key()
+                if cache_key is not None and cache_key == _LISTING_CACHE["key"]:
+                    debug_log("Reusing cached file listing")
+                    _LISTED_ITEMS.extend(_LISTING_CACHE["items"])
+                    _LISTED_FILES.update(_LISTING_CACHE["items"])
+                    _show_listed_items()
+                    set_list_note(_LISTING_CACHE["note"])
+                    update_status(_LISTING_CACHE["status"], flush=False)
+                    return
                 
-                status_message = f"Status: iPhone mounted - {file_count} files listed"
-                if skipped_count > 0:
-                    status_message += f" ({skipped_count} system files hidden)"
-                if reached_limit:
-                    status_message += f" (display limited to {max_files} files)"
-                    
-                update_status(status_message)
-                debug_log(f"Listed {file_count} files, hid {skipped_count} system files")
+                _LIST_IN_FLIGHT = True
+                threading.Thread(target=_list_files_worker,
+                                 args=(_LIST_GENERATION, CURRENT_MOUNT_TYPE == "media", documents_mode,
+                                       cache_key, _saved_listing_key()),
+                                 daemon=True).start()
                 
             except tk.TclError:
                 # Widget destroyed
@@ -790,12 +972,384 @@ def list_files():
         # Widget destroyed
         return
 
+def invalidate_listing_cache():
+    """Forget the cached listing so the next list_files() walks the mount again"""
+    _LISTING_CACHE["key"] = None
+    _LISTING_CACHE["items"] = ()
+
+def _listing_cache_key():
+    """Identify the current mount contents for _LISTING_CACHE, or None if it can't be read
+    
+    Only the top-level directory's mtime is checked; changes deeper in the
+    tree are picked up by Refresh Files, which always walks the mount. The
+    key only tells listings apart within one mount, so anything that mounts,
+    unmounts or resets MOUNT_PATH clears the cache.
+    """
+    try:
+        st = os.stat(MOUNT_PATH)
+    except OSError:
+        return None
+    return (CURRENT_MOUNT_TYPE, CURRENT_APP_ID, st.st_dev, st.st_mtime_ns)
+
+def _saved_listing_key():
+    """Key for the mounted device and folder in LISTING_DB, or None if either is unknown
+    
+    Only uses the UDID that get_device_udid() cached when mount_iphone() picked
+    the device to mount; a mount this session didn't make gets no saved listing.
+    """
+    if not _DEVICE_UDID:
+        return None
+    if CURRENT_MOUNT_TYPE == "media":
+        return f"{_DEVICE_UDID}:media"
+    if CURRENT_MOUNT_TYPE == "documents" and CURRENT_APP_ID:
+        return f"{_DEVICE_UDID}:{CURRENT_APP_ID}"
+    return None
+
+def _load_saved_listing(key):
+    """Return the file names saved in LISTING_DB for key, in listing order"""
+    if not os.path.exists(LISTING_DB):
+        return []
+    try:
+        with contextlib.closing(sqlite3.connect(LISTING_DB)) as db:
+            rows = db.execute("SELECT name FROM entries WHERE listing = ? ORDER BY pos", (key,))
+            return [name for name, in rows]
+    except sqlite3.Error as e:
+        debug_log(f"Could not read saved listing: {e}")
+        return []
+
+def _save_listing(key, names):
+    """Replace the names saved in LISTING_DB for key in a single transaction"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with contextlib.closing(sqlite3.connect(LISTING_DB)) as db:
+            with db:
+                db.execute("CREATE TABLE IF NOT EXISTS entries "
+                           "(listing TEXT, pos INTEGER, name TEXT, PRIMARY KEY (listing, pos))")
+                db.execute("DELETE FROM entries WHERE listing = ?", (key,))
+                db.executemany("INSERT INTO entries VALUES (?, ?, ?)",
+                               ((key, pos, name) for pos, name in enumerate(names)))
+    except (OSError, sqlite3.Error) as e:
+        debug_log(f"Could not save listing: {e}")
+
+def _list_files_worker(generation, media_mode, documents_mode, cache_key=None, saved_key=None):
+    """Walk the mount point and queue batches of file names (runs on a worker thread)
+    
+    If LISTING_DB has a listing under saved_key, that is shown straight away
+    and replaced in one go once the walk is done, instead of filling the list
+    batch by batch. saved_key comes from _saved_listing_key() on the main thread.
+    """
+    file_count = 0
+    skipped_count = 0
+    batch_size = 1000  # Process files in batches for better UI responsiveness
+    current_batch = []
+    listed = []
+    max_files = 5000  # Limit max files to show for performance
+    reached_limit = False
+    
+    try:
+        saved = _load_saved_listing(saved_key) if saved_key else []
+        if saved:
+            call_in_ui(_show_saved_listing, generation, saved)
+        
+        if media_mode:
+            paths = _find_media_files()
+        else:
+            # Other mounts only skip the SYSTEM_DIRECTORIES trees (.Trashes,
+            # .com.apple, ...) and list every file in the rest
+            paths = _walk_files(skip_dir=_in_system_directory)
+            
+        try:
+            for relative_path in paths:
+                # Skip system files in media mode; parent directories were already checked
+                if media_mode and _is_system_basename(os.path.basename(relative_path)):
+                    skipped_count += 1
+                    continue
+                
+                # Stop at the display limit; there is at least one more file
+                if file_count >= max_files:
+                    reached_limit = True
+                    break
+                
+                # Add to current batch
+                current_batch.append(relative_path)
+                file_count += 1
+                
+                # Process batch
+                if len(current_batch) >= batch_size:
+                    # Stop early if a newer listing has started
+                    if generation != _LIST_GENERATION:
+                        return
+                        
+                    listed.extend(current_batch)
+                    if saved:
+                        call_in_ui(update_status, f"Status: Checking saved list, {file_count} files found...", False)
+                    else:
+                        call_in_ui(_add_listed_files, generation, current_batch, file_count)
+                    current_batch = []
+        finally:
+            # Stops the find process if we broke out early
+            paths.close()
+        
+        # Add any remaining files in the last batch
+        listed.extend(current_batch)
+        if saved:
+            call_in_ui(_replace_listed_files, generation, listed)
+        else:
+            call_in_ui(_add_listed_files, generation, current_batch, file_count)
+        if saved_key and listed != saved:
+            _save_listing(saved_key, listed)
+            
+        call_in_ui(_finish_listing, generation, file_count, skipped_count, reached_limit, max_files, documents_mode,
+                   cache_key)
+    except Exception as e:
+        debug_log(traceback.format_exc())
+        call_in_ui(_listing_failed, generation, e)
+    finally:
+        call_in_ui(_listing_done)
+
+def _listing_done():
+    """Start the listing requested while _list_files_worker() was running, if any"""
+    global _LIST_IN_FLIGHT, _LIST_PENDING
+    _LIST_IN_FLIGHT = False
+    if _LIST_PENDING:
+        _LIST_PENDING = False
+        list_files()
+
+def cancel_listing():
+    """Drop the running listing's results and any relist queued behind it"""
+    global _LIST_GENERATION, _LIST_PENDING
+    _LIST_GENERATION += 1
+    _LIST_PENDING = False
+
+def set_list_note(text):
+    """Show notes about the current listing below the file list, outside the list itself"""
+    try:
+        list_note_label.config(text=text)
+    except tk.TclError:
+        # Widget destroyed
+        pass
+
+def _show_listed_items():
+    """Push _LISTED_ITEMS to the Listbox through its list variable in one Tcl call"""
+    file_list_var.set(tuple(_LISTED_ITEMS))
+
+def _add_listed_files(generation, batch, file_count):
+    """Append a batch from _list_files_worker() to the file list"""
+    if generation != _LIST_GENERATION or not batch:
+        return
+    try:
+        _LISTED_ITEMS.extend(batch)
+        _LISTED_FILES.update(batch)
+        _show_listed_items()
+        update_status(f"Status: Listed {file_count} files...", flush=False)
+    except tk.TclError:
+        # Widget destroyed
+        return
+
+def _show_saved_listing(generation, names):
+    """Show the listing saved in LISTING_DB while _list_files_worker() rescans"""
+    if generation != _LIST_GENERATION or _LISTED_ITEMS:
+        return
+    try:
+        # Not added to _LISTED_FILES: these may no longer exist on the device
+        _LISTED_ITEMS.extend(names)
+        _show_listed_items()
+        update_status("Status: Showing saved list, checking for changes...", flush=False)
+    except tk.TclError:
+        # Widget destroyed
+        return
+
+def _replace_listed_files(generation, names):
+    """Swap the whole file list for the result of a finished walk"""
+    if generation != _LIST_GENERATION:
+        return
+    try:
+        _LISTED_FILES.clear()
+        _LISTED_FILES.update(names)
+        # Usually the saved listing was still right; then leave the widget alone
+        if names != _LISTED_ITEMS:
+            _LISTED_ITEMS[:] = names
+            _show_listed_items()
+    except tk.TclError:
+        # Widget destroyed
+        return
+
+def _finish_listing(generation, file_count, skipped_count, reached_limit, max_files, documents_mode,
+                    cache_key=None):
+    """Add trailing notes and the final status once _list_files_worker() is done"""
+    if generation != _LIST_GENERATION:
+        return
+    try:
+        notes = [DOCUMENTS_NOTE] if documents_mode else []
+        # Add instructions if empty folder            
+        if file_count == 0 and documents_mode:
+            notes.append("This folder is empty. Use the 'Upload File to iPhone' button to upload files.")
+        
+        # Show message if we hit the display limit
+        if reached_limit:
+            notes.append(f"Only showing the first {max_files} files. "
+                         "Use the search feature to find specific files.")
+        note = "\n".join(notes)
+        set_list_note(note)
+        
+        status_message = f"Status: iPhone mounted - {file_count} files listed"
+        if skipped_count > 0:
+            status_message += f" ({skipped_count} system files hidden)"
+        if reached_limit:
+            status_message += f" (display limited to {max_files} files)"
+            
+        update_status(status_message, flush=False)
+        debug_log(f"Listed {file_count} files, hid {skipped_count} system files")
+        
+        if cache_key is not None:
+            _LISTING_CACHE.update(key=cache_key, items=tuple(_LISTED_ITEMS), note=note, status=status_message)
+    except tk.TclError:
+        # Widget destroyed
+        return
+
+def _listing_failed(generation, error):
+    """Report an error raised by _list_files_worker()"""
+    if generation != _LIST_GENERATION:
+        return
+    messagebox.showerror("Error", f"Failed to list files: {str(error)}")
+    update_status(f"Status: Error listing files - {str(error)[:30]}...")
+
+def _scan_dir(rel_dir, skip_dir):
+    """Read one directory below the mount point (may run on a listing pool thread)
+    
+    Uses os.scandir directly so the entry type comes from the directory read
+    itself and no extra stat is needed to tell files from directories.
+    
+    Returns:
+        tuple: (subdirectories to descend into, file paths), relative to MOUNT_PATH
+    """
+    prefix = rel_dir + '/' if rel_dir else ''
+    subdirs = []
+    files = []
+    try:
+        with os.scandir(_MOUNT_PREFIX + rel_dir) as entries:
+            for entry in entries:
+                rel_path = prefix + entry.name
+                # The type comes from readdir; only symlinks need a stat to
+                # see what they point to
+                if entry.is_dir(follow_symlinks=False):
+                    # Prune system directories so we never descend into them
+                    if not (skip_dir and skip_dir(rel_path)):
+                        subdirs.append(rel_path)
+                elif not (entry.is_symlink() and entry.is_dir()):
+                    # Like os.walk, directory symlinks are neither followed nor listed
+                    files.append(rel_path)
+    except OSError as e:
+        debug_log(f"Error processing directory {rel_dir or MOUNT_PATH}: {e}")
+    return subdirs, files
+
+def _walk_files(skip_dir=None):
+    """Yield file paths relative to MOUNT_PATH, breadth first
+    
+    Each directory read is a round trip to the device, so up to
+    LISTING_WORKERS directories are read at once. Results are still yielded
+    in breadth-first order.
+    
+    Args:
+        skip_dir: Optional check called with each directory's relative path;
+                  directories it returns True for are not descended into
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=LISTING_WORKERS)
+    pending = collections.deque([pool.submit(_scan_dir, "", skip_dir)])
+    try:
+        while pending:
+            subdirs, files = pending.popleft().result()
+            for rel_dir in subdirs:
+                pending.append(pool.submit(_scan_dir, rel_dir, skip_dir))
+            yield from files
+    finally:
+        # Drop queued reads if the caller stopped early
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+def _find_media_files():
+    """Yield file paths relative to MOUNT_PATH from a single find process
+    
+    System directories are pruned by find itself, so the whole traversal
+    runs in C and only the basename check is left to Python.
+    """
+    # NUL-separated, so names containing newlines come through intact
+    command = ["find", MOUNT_PATH] + _FIND_PRUNE_ARGS + ["-type", "f", "-print0"]
+    debug_log(f"Running: {' '.join(command)}")
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                   bufsize=1 << 20)
+    except OSError as e:
+        debug_log(f"find unavailable, falling back to a directory walk: {e}")
+        yield from _walk_files(skip_dir=_is_system_dir)
+        return
+        
+    prefix_len = len(os.fsencode(_MOUNT_PREFIX))
+    try:
+        tail = b""
+        while True:
+            chunk = process.stdout.read1(1 << 16)
+            if not chunk:
+                break
+            names = (tail + chunk).split(b"\0")
+            # The last piece is an incomplete name (or empty after a final NUL)
+            tail = names.pop()
+            for name in names:
+                # Decode like os.listdir() does, so undecodable names still
+                # round-trip to the right file instead of failing the listing
+                yield os.fsdecode(name[prefix_len:])
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.wait()
+
+def refresh_files():
+    """Handle the Refresh Files button: drop cached device data and relist"""
+    if mount_point_busy():
+        return
+    invalidate_listing_cache()
+    invalidate_app_list_cache()
+    list_files()
+
 def get_mount_type():
-    """Check what type of mount we currently have"""
+    """Check what type of mount we currently have
+    
+    Returns the mount table line for MOUNT_PATH, or None if it isn't mounted.
+    The answer is reused for MOUNT_CACHE_TTL seconds.
+    """
+    now = time.monotonic()
+    if _MOUNT_CACHE["info_ts"] and now - _MOUNT_CACHE["info_ts"] < MOUNT_CACHE_TTL:
+        return _MOUNT_CACHE["info"]
+    _MOUNT_CACHE["info"] = _read_mount_info()
+    _MOUNT_CACHE["info_ts"] = now
+    return _MOUNT_CACHE["info"]
+
+def _read_mount_info():
+    """Find the mount table line for MOUNT_PATH
+    
+    Reads /proc/self/mountinfo directly and only runs mount(8) where that
+    file doesn't exist.
+    """
+    debug_log("Checking mount type")
     try:
-        debug_log("Checking mount type")
-        result = subprocess.run(["mount"], capture_output=True, text=True)
-        for line in result.stdout.splitlines():
+        with open("/proc/self/mountinfo") as f:
+            for line in f:
+                # Field 5 is the mount point, with spaces escaped as \040
+                fields = line.split(" ", 5)
+                if len(fields) > 4 and fields[4].replace("\\040", " ") == MOUNT_PATH:
+                    debug_log(f"Mount line: {line.rstrip()}")
+                    return line.rstrip()
+        return None
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        debug_log(f"Error reading mountinfo: {e}")
+        
+    try:
+        result = subprocess.run(["mount"], capture_output=True)
+        for line in result.stdout.decode('utf-8', 'replace').splitlines():
             if MOUNT_PATH in line:
                 debug_log(f"Mount line: {line}")
                 return line
@@ -819,8 +1373,8 @@ def is_documents_mount():
     if not mount_info:
         return False
         
-    # Look for documents in the mount info
-    is_docs = "documents" in mount_info.lower() or "--documents" in mount_info.lower()
+    # Look for documents in the mount info ("--documents" contains it too)
+    is_docs = "documents" in mount_info.lower()
     
     # Update our internal tracking if we found something
     if is_docs:
@@ -832,6 +1386,49 @@ def is_documents_mount():
         
     return is_docs
 
+def _kernel_copy(copy_chunk, src, dst, name):
+    """Call copy_chunk(src_fd, dst_fd) until the source is used up
+    
+    Returns False if the kernel refuses the call for these files or stops
+    short of the end, so the caller can carry on with a slower method from
+    the current offsets.
+    """
+    src_fd, dst_fd = src.fileno(), dst.fileno()
+    try:
+        while copy_chunk(src_fd, dst_fd) > 0:
+            pass
+    except OSError as e:
+        if e.errno not in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EXDEV):
+            raise
+        debug_log(f"{name} not supported ({e})")
+        return False
+    # Some filesystems report EOF early instead of failing
+    return src.tell() >= os.fstat(src_fd).st_size
+
+def copy_file(source_path, dest_path):
+    """Copy a file and its metadata, keeping the data in the kernel where possible
+    
+    Tries os.copy_file_range(), then os.sendfile(), so bytes don't pass
+    through Python, and falls back to a buffered copy if neither works for
+    these filesystems. Each step resumes where the previous one stopped.
+    """
+    _ACTIVE_TRANSFERS.add(dest_path)
+    try:
+        with open(source_path, 'rb', buffering=0) as src, open(dest_path, 'wb', buffering=0) as dst:
+            done = False
+            if hasattr(os, 'copy_file_range'):
+                done = _kernel_copy(lambda i, o: os.copy_file_range(i, o, SENDFILE_CHUNK_SIZE),
+                                    src, dst, "copy_file_range")
+            if not done and hasattr(os, 'sendfile'):
+                done = _kernel_copy(lambda i, o: os.sendfile(o, i, None, SENDFILE_CHUNK_SIZE),
+                                    src, dst, "sendfile")
+            if not done:
+                # Both files are unbuffered, so this resumes where the kernel copy stopped
+                shutil.copyfileobj(src, dst, COPY_BUFFER_SIZE)
+    finally:
+        _ACTIVE_TRANSFERS.discard(dest_path)
+    shutil.copystat(source_path, dest_path)
+
 def download_file():
     try:
         selected = file_list.curselection()
@@ -843,10 +1440,6 @@ def download_file():
         if len(selected) == 1:
             # Single file download - ask for destination
             selected_file = file_list.get(selected[0])
-            if selected_file.startswith("---") or not selected_file.strip():
-                messagebox.showinfo("Invalid Selection", "Please select a valid file to download.")
-                return
-                
             source_path = os.path.join(MOUNT_PATH, selected_file)
             
             if not os.path.exists(source_path):
@@ -857,23 +1450,23 @@ def download_file():
             if save_path:
                 update_status(f"Status: Downloading {os.path.basename(selected_file)}...")
                 
-                shutil.copy2(source_path, save_path)
-                messagebox.showinfo("Saved", f"File saved to {save_path}")
-                update_status(f"Status: Downloaded to {os.path.basename(save_path)}")
+                # Copy on a worker thread so large files don't freeze the window
+                run_in_background(lambda: copy_file(source_path, save_path),
+                                  lambda result, error: _finish_single_download(error, save_path))
         else:
             # Multiple files download - ask for destination directory
             dir_path = filedialog.askdirectory(title="Select Download Destination Folder")
             if not dir_path:
                 return  # User canceled
                 
-            # Count valid selections (skip header/info lines)
+            # Count valid selections, fetching all rows in one Tcl call
+            items = file_list.get(0, END)
             valid_files = []
-            for idx in selected:
-                selected_file = file_list.get(idx)
-                if not selected_file.startswith("---") and selected_file.strip():
-                    source_path = os.path.join(MOUNT_PATH, selected_file)
-                    if os.path.exists(source_path) and os.path.isfile(source_path):
-                        valid_files.append((source_path, selected_file))
+            for selected_file in (items[idx] for idx in selected):
+                source_path = _MOUNT_PREFIX + selected_file
+                # The listing only contains files, so only stat entries it doesn't know
+                if selected_file in _LISTED_FILES or os.path.isfile(source_path):
+                    valid_files.append((source_path, selected_file))
             
             if not valid_files:
                 messagebox.showinfo("Invalid Selection", "No valid files selected for download.")
@@ -884,39 +1477,10 @@ def download_file():
             if not messagebox.askyesno("Confirm Download", f"Download {count} files to {dir_path}?"):
                 return
                 
-            # Download all selected files
-            success_count = 0
-            fail_count = 0
-            
-            for i, (source_path, file_path) in enumerate(valid_files):
-                try:
-                    filename = os.path.basename(file_path)
-                    dest_path = os.path.join(dir_path, filename)
-                    
-                    # Update status every file
-                    update_status(f"Status: Downloading file {i+1} of {count}: {filename}...")
-                    root.update_idletasks()
-                    
-                    # Copy the file
-                    shutil.copy2(source_path, dest_path)
-                    success_count += 1
-                    
-                    # Update UI every 5 files
-                    if i % 5 == 0:
-                        root.update_idletasks()
-                except Exception as e:
-                    debug_log(f"Error downloading {file_path}: {e}")
-                    fail_count += 1
-            
-            # Show summary
-            if fail_count > 0:
-                messagebox.showinfo("Download Summary", 
-                                   f"Downloaded {success_count} files successfully.\n"
-                                   f"Failed to download {fail_count} files.")
-                update_status(f"Status: Downloaded {success_count} files, {fail_count} failed")
-            else:
-                messagebox.showinfo("Download Complete", f"Successfully downloaded {success_count} files to {dir_path}")
-                update_status(f"Status: Downloaded {success_count} files")
+            # Download all selected files on a worker thread
+            update_status(f"Status: Downloading {count} files...")
+            run_in_background(lambda: _download_files(valid_files, dir_path),
+                              lambda counts, error: _finish_download(counts, error, dir_path))
     except tk.TclError:
         # Widget destroyed
         return
@@ -924,6 +1488,155 @@ def download_file():
         messagebox.showerror("Error", f"Download error: {str(e)}")
         update_status(f"Status: Download error - {str(e)[:30]}...")
 
+def _finish_single_download(error, save_path):
+    """Report a single-file download (runs on the Tk main thread)"""
+    if error is not None:
+        messagebox.showerror("Error", f"Download error: {str(error)}")
+        update_status(f"Status: Download error - {str(error)[:30]}...")
+        return
+    messagebox.showinfo("Saved", f"File saved to {save_path}")
+    update_status(f"Status: Downloaded to {os.path.basename(save_path)}")
+
+def _download_files(valid_files, dir_path):
+    """Copy (source_path, file_path) pairs into dir_path (runs on a worker thread)
+    
+    Up to DOWNLOAD_WORKERS files are copied at once, so reads from the device
+    overlap with each other and with writes to the local disk.
+    
+    Returns:
+        tuple: (success_count, fail_count)
+    """
+    success_count = 0
+    fail_count = 0
+    count = len(valid_files)
+    last_update = 0.0
+    # file_path comes from the listing, so it is already normalized
+    sep = os.sep
+    dest_prefix = dir_path.rstrip(sep) + sep
+    
+    # Files with the same name go to the same destination; copy those in
+    # selection order within one task so the last one still wins
+    jobs = {}
+    for source_path, file_path in valid_files:
+        filename = file_path.rsplit(sep, 1)[-1]
+        jobs.setdefault(f"{dest_prefix}{filename}", []).append((source_path, file_path))
+    
+    def download(dest_path, sources):
+        copied = 0
+        for source_path, file_path in sources:
+            try:
+                copy_file(source_path, dest_path)
+                copied += 1
+            except Exception as e:
+                debug_log(f"Error downloading {file_path}: {e}")
+        return copied, len(sources) - copied
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as pool:
+        futures = [pool.submit(download, dest_path, sources) for dest_path, sources in jobs.items()]
+        for future in concurrent.futures.as_completed(futures):
+            copied, failed = future.result()
+            success_count += copied
+            fail_count += failed
+            
+            # Update status at most every STATUS_UPDATE_INTERVAL, so batches of
+            # small files don't flood the UI queue
+            now = time.monotonic()
+            if now - last_update >= STATUS_UPDATE_INTERVAL:
+                last_update = now
+                call_in_ui(update_status, f"Status: Downloaded {success_count + fail_count} of {count} files...", False)
+            
+    return success_count, fail_count
+
+def _finish_download(counts, error, dir_path):
+    """Show the summary for _download_files() (runs on the Tk main thread)"""
+    if error is not None:
+        messagebox.showerror("Error", f"Download error: {str(error)}")
+        update_status(f"Status: Download error - {str(error)[:30]}...")
+        return
+        
+    success_count, fail_count = counts
+    if fail_count > 0:
+        messagebox.showinfo("Download Summary", 
+                           f"Downloaded {success_count} files successfully.\n"
+                           f"Failed to download {fail_count} files.")
+        update_status(f"Status: Downloaded {success_count} files, {fail_count} failed")
+    else:
+        messagebox.showinfo("Download Complete", f"Successfully downloaded {success_count} files to {dir_path}")
+        update_status(f"Status: Downloaded {success_count} files")
+
+class _ProgressReader:
+    """File wrapper that reports upload progress in the status bar as it is read
+    
+    Used from the upload worker thread, so status updates go through call_in_ui().
+    """
+    
+    def __init__(self, file_obj, total_size, filename):
+        self.file_obj = file_obj
+        self.total_size = total_size
+        self.filename = filename
+        self.copied = 0
+        self.last_percent = -1
+        
+    def read(self, size=-1):
+        chunk = self.file_obj.read(size)
+        self.advance(len(chunk))
+        return chunk
+        
+    def advance(self, count):
+        """Record count bytes copied without going through read(); returns count"""
+        self.copied += count
+        if self.total_size:
+            percent = self.copied * 100 // self.total_size
+            if percent != self.last_percent:
+                self.last_percent = percent
+                call_in_ui(update_status, f"Status: Uploading {self.filename} ({percent}%)...", False)
+        return count
+
+def _read_ahead(src, chunks, stop):
+    """Read src into the chunks queue until EOF (runs on its own thread)
+    
+    Puts b"" at EOF, or the exception if reading fails. Gives up as soon as
+    stop is set, so a failed write never leaves this thread blocked.
+    """
+    def put(item):
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    try:
+        while True:
+            chunk = src.read(COPY_BUFFER_SIZE)
+            if not put(chunk) or not chunk:
+                return
+    except Exception as e:
+        put(e)
+
+def _copy_with_read_ahead(src, dst):
+    """Copy src to dst, reading the next chunks while the current one is written
+    
+    Writes to the device dominate an upload, so overlapping them with the
+    local reads keeps the FUSE connection busy.
+    """
+    chunks = queue.Queue(maxsize=UPLOAD_READ_AHEAD)
+    stop = threading.Event()
+    reader = threading.Thread(target=_read_ahead, args=(src, chunks, stop), daemon=True)
+    reader.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                break
+            dst.write(chunk)
+    finally:
+        stop.set()
+        reader.join()
+
 def upload_file():
     if not check_mount():
         messagebox.showerror("Error", "iPhone not mounted.")
@@ -944,77 +1657,67 @@ def upload_file():
     if not file_path:
         return  # User canceled
         
-    try:
-        # Get basename for destination
-        filename = os.path.basename(file_path)
-        dest = os.path.join(MOUNT_PATH, filename)
-        
-        update_status(f"Status: Uploading {filename}...")
-        
+    # Get basename for destination
+    filename = os.path.basename(file_path)
+    dest = os.path.join(MOUNT_PATH, filename)
+    
+    update_status(f"Status: Uploading {filename}...")
+    run_in_background(lambda: _do_upload(file_path, dest, filename),
+                      lambda result, error: _finish_upload(error, filename))
+
+def _do_upload(file_path, dest, filename):
+    """Copy file_path to dest on the device (runs on a worker thread)"""
+    # Copy chunk by chunk, which is more reliable on iOS than one big write
+    debug_log(f"Attempting chunk-by-chunk copy from {file_path} to {dest}")
+    
+    # Use binary mode for consistent behavior
+    with open(file_path, 'rb') as src_file:
+        # Get file size for progress updates from the open file, no second path lookup
+        file_size = os.fstat(src_file.fileno()).st_size
+        _ACTIVE_TRANSFERS.add(dest)
         try:
-            # Use a chunk-by-chunk copy method which is more reliable on iOS
-            debug_log(f"Attempting chunk-by-chunk copy from {file_path} to {dest}")
-            
-            # Get file size for progress updates
-            file_size = os.path.getsize(file_path)
+            with open(dest, 'wb') as dest_file:
+                # Large writes mean fewer FUSE round trips to the device.
+                # sendfile() keeps the data in the kernel; the read-ahead copy
+                # carries on from the same offsets if the mount refuses it.
+                reader = _ProgressReader(src_file, file_size, filename)
+                sent = hasattr(os, 'sendfile') and _kernel_copy(
+                    lambda i, o: reader.advance(os.sendfile(o, i, None, COPY_BUFFER_SIZE)),
+                    src_file, dest_file, "sendfile")
+                if not sent:
+                    _copy_with_read_ahead(reader, dest_file)
+        except PermissionError as e:
+            debug_log(f"Permission error during file writing: {e}")
+            raise
+        except OSError as e:
+            debug_log(f"OS error during file writing: {e}")
             
-            # Use binary mode for consistent behavior
-            with open(file_path, 'rb') as src_file:
+            # If dest file exists but is incomplete, try to remove it
+            if os.path.exists(dest):
                 try:
-                    with open(dest, 'wb') as dest_file:
-                        copied = 0
-                        chunk_size = 1024 * 64  # 64KB chunks
-                        
-                        while True:
-                            chunk = src_file.read(chunk_size)
-                            if not chunk:
-                                break
-                                
-                            dest_file.write(chunk)
-                            copied += len(chunk)
-                            
-                            # Update progress every 10 chunks
-                            if copied % (chunk_size * 10) < chunk_size:
-                                percent = int((copied / file_size) * 100)
-                                update_status(f"Status: Uploading {filename} ({percent}%)...")
-                                root.update_idletasks()
-                    
-                    debug_log(f"File copy successful: {filename}")
-                    messagebox.showinfo("Uploaded", f"File {filename} uploaded to iPhone.\n\n" +
-                                      "You can access this file in the app on your iPhone.")
-                    update_status(f"Status: Uploaded {filename}")
-                    
-                    # Refresh the file list
-                    list_files()
-                    
-                except PermissionError as e:
-                    debug_log(f"Permission error during file writing: {e}")
-                    raise
-                except OSError as e:
-                    debug_log(f"OS error during file writing: {e}")
-                    
-                    # If dest file exists but is incomplete, try to remove it
-                    if os.path.exists(dest):
-                        try:
-                            os.remove(dest)
-                            debug_log(f"Removed incomplete file: {dest}")
-                        except:
-                            pass
-                    
-                    if "Function not implemented" in str(e):
-                        # This is a common error with ifuse/iOS
-                        messagebox.showerror("iOS Limitation", 
-                                          "This iOS app's Documents folder doesn't support file uploads.\n\n" +
-                                          "Try these solutions:\n" +
-                                          "1. Try a different app (Firefox, Chrome often work)\n" +
-                                          "2. Use iTunes file sharing instead\n" +
-                                          "3. Use native iOS file sharing features")
-                        update_status("Status: This app doesn't support file uploads")
-                    else:
-                        raise
-                    
-        except PermissionError as e:
-            debug_log(f"Permission error: {e}")
+                    os.remove(dest)
+                    debug_log(f"Removed incomplete file: {dest}")
+                except:
+                    pass
+            raise
+        finally:
+            _ACTIVE_TRANSFERS.discard(dest)
+            
+    debug_log(f"File copy successful: {filename}")
+
+def _finish_upload(error, filename):
+    """Report the result of _do_upload() (runs on the Tk main thread)"""
+    try:
+        if error is None:
+            messagebox.showinfo("Uploaded", f"File {filename} uploaded to iPhone.\n\n" +
+                              "You can access this file in the app on your iPhone.")
+            update_status(f"Status: Uploaded {filename}")
+            
+            # Refresh the file list
+            invalidate_listing_cache()
+            list_files()
+        elif isinstance(error, PermissionError):
+            debug_log(f"Permission error: {error}")
             messagebox.showerror("Permission Error", 
                                "Cannot write to iPhone filesystem. This may be due to iOS restrictions.\n\n"
                                "Try these solutions:\n"
@@ -1022,26 +1725,23 @@ def upload_file():
                                "2. Try a different app's Documents folder\n"
                                "3. Check if your iPhone is locked")
             update_status("Status: Upload failed - Permission error")
-        except OSError as e:
-            debug_log(f"OS error: {e}")
-            if "Function not implemented" in str(e):
-                messagebox.showerror("iOS Limitation", 
-                                   "This iOS app's Documents folder doesn't support file uploads.\n\n" +
-                                   "Try these solutions:\n" +
-                                   "1. Try a different app (Firefox, Chrome often work)\n" +
-                                   "2. Use iTunes file sharing instead\n" +
-                                   "3. Use native iOS file sharing features")
-                update_status("Status: This app doesn't support file uploads")
-            else:
-                raise
-                
+        elif isinstance(error, OSError) and "Function not implemented" in str(error):
+            # This is a common error with ifuse/iOS
+            debug_log(f"OS error: {error}")
+            messagebox.showerror("iOS Limitation", 
+                               "This iOS app's Documents folder doesn't support file uploads.\n\n" +
+                               "Try these solutions:\n" +
+                               "1. Try a different app (Firefox, Chrome often work)\n" +
+                               "2. Use iTunes file sharing instead\n" +
+                               "3. Use native iOS file sharing features")
+            update_status("Status: This app doesn't support file uploads")
+        else:
+            debug_log(f"Upload error: {error}")
+            messagebox.showerror("Error", f"Upload error: {str(error)}\n\nThis might be due to iOS restrictions on file writing.")
+            update_status(f"Status: Upload error - {str(error)[:30]}...")
     except tk.TclError:
         # Widget destroyed
         return
-    except Exception as e:
-        debug_log(f"Upload error: {e}")
-        messagebox.showerror("Error", f"Upload error: {str(e)}\n\nThis might be due to iOS restrictions on file writing.")
-        update_status(f"Status: Upload error - {str(e)[:30]}...")
 
 def show_help():
     """Display help information about iPhone file transfers"""
@@ -1135,8 +1835,24 @@ Tips:
     # Force focus on help window
     help_window.focus_force()
 
+def _remove_partial_transfers():
+    """Delete the destination files of downloads and uploads still being written"""
+    for dest_path in list(_ACTIVE_TRANSFERS):
+        try:
+            os.remove(dest_path)
+            debug_log(f"Removed incomplete file: {dest_path}")
+        except OSError as e:
+            debug_log(f"Could not remove incomplete file {dest_path}: {e}")
+
 def on_closing():
     """Handle window closing event"""
+    # Exiting kills the worker threads, so a running copy would leave a truncated file
+    if _ACTIVE_TRANSFERS:
+        if not messagebox.askyesno("Transfer in Progress",
+                                   "A file transfer is still running. Exit anyway?\n\n"
+                                   "Partly copied files will be deleted."):
+            return
+        _remove_partial_transfers()
     try:
         if check_mount():
             debug_log("Closing window while iPhone mounted, asking user to unmount")
@@ -1158,6 +1874,11 @@ def on_closing():
                     print(f"Unmount error: {str(e)}")
         debug_log("Cleaning up and exiting")
         
+        # Don't leave a half-finished ifuse behind
+        if MOUNT_PROCESS is not None and MOUNT_PROCESS.poll() is None:
+            debug_log("Cancelling mount in progress")
+            MOUNT_PROCESS.kill()
+        
         # Try to release the lock
         try:
             if 'lock_socket' in globals():
@@ -1174,60 +1895,94 @@ def on_closing():
             root.destroy()
         except:
             pass
-    # Force exit to avoid hanging threads
+    # Force exit to avoid hanging threads; os._exit() skips atexit handlers
+    flush_log()
     os._exit(0)
 
 def deep_clean_mount_point():
-    """Perform a deep clean of the mount point using sudo if available"""
+    """Perform a deep clean of the mount point using sudo if available
+    
+    The commands run on a worker thread, since sudo may sit waiting for a
+    password in the terminal.
+    """
+    if mount_point_busy() or transfer_in_progress():
+        return
+    debug_log("Performing deep clean of mount point")
+    set_mount_point_busy("Deep clean")
+    invalidate_listing_cache()
+    update_status("Status: Deep cleaning mount point...")
+    run_in_background(_do_deep_clean, _finish_deep_clean)
+
+def _do_deep_clean():
+    """Unmount and recreate the mount point with sudo (runs on a worker thread)
+    
+    Returns:
+        bool: True if the mount point ended up as a writable directory
+    """
     try:
-        debug_log("Performing deep clean of mount point")
-        
         # First try basic unmount
         subprocess.run(["fusermount", "-u", MOUNT_PATH], stderr=subprocess.PIPE, stdout=subprocess.PIPE)
         
-        # Try to use sudo to fix permissions and clean up
-        commands = [
-            ["sudo", "umount", "-f", MOUNT_PATH],
-            ["sudo", "rm", "-rf", MOUNT_PATH],
-            ["sudo", "mkdir", "-p", MOUNT_PATH],
-            ["sudo", "chown", f"{os.getuid()}:{os.getgid()}", MOUNT_PATH],
-            ["sudo", "chmod", "755", MOUNT_PATH]
-        ]
-        
-        for cmd in commands:
-            debug_log(f"Running: {' '.join(cmd)}")
-            result = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
-            debug_log(f"Result: {result.returncode}")
-        
-        if os.path.exists(MOUNT_PATH) and os.access(MOUNT_PATH, os.W_OK):
-            debug_log("Deep clean successful")
-            messagebox.showinfo("Deep Clean", "Successfully performed deep clean of mount point.")
-            update_status("Status: Mount point deep cleaned")
-            return True
-        else:
-            debug_log("Deep clean failed to create writable directory")
-            messagebox.showerror("Deep Clean Failed", 
-                               "Could not create a writable mount point.\n\n"
-                               "Try running the following commands in terminal:\n"
-                               "sudo fusermount -u ~/iPhoneMount\n"
-                               "sudo rm -rf ~/iPhoneMount\n"
-                               "mkdir -p ~/iPhoneMount")
-            update_status("Status: Deep clean failed")
-            return False
-    except Exception as e:
-        debug_log(f"Deep clean error: {e}")
-        messagebox.showerror("Deep Clean Error", f"Error during deep clean: {str(e)}")
+        # Try to use sudo to fix permissions and clean up, in a single shell so
+        # sudo is only started once
+        path = shlex.quote(MOUNT_PATH)
+        script = "; ".join([
+            f"umount -f {path}",
+            f"rm -rf {path}",
+            f"mkdir -p {path}",
+            f"chown {_UID_GID} {path}",
+            f"chmod 755 {path}",
+        ])
+        cmd = ["sudo", "sh", "-c", script]
+        debug_log(f"Running: {' '.join(cmd)}")
+        result = subprocess.run(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE)
+        debug_log(f"Result: {result.returncode}")
+    finally:
+        invalidate_mount_cache()
+    
+    return os.path.exists(MOUNT_PATH) and os.access(MOUNT_PATH, os.W_OK)
+
+def _finish_deep_clean(success, error):
+    """Report the result of _do_deep_clean() (runs on the Tk main thread)"""
+    set_mount_point_busy(None)
+    if error is not None:
+        debug_log(f"Deep clean error: {error}")
+        messagebox.showerror("Deep Clean Error", f"Error during deep clean: {str(error)}")
         update_status("Status: Deep clean error")
-        return False
+    elif success:
+        debug_log("Deep clean successful")
+        messagebox.showinfo("Deep Clean", "Successfully performed deep clean of mount point.")
+        update_status("Status: Mount point deep cleaned")
+    else:
+        debug_log("Deep clean failed to create writable directory")
+        messagebox.showerror("Deep Clean Failed", 
+                           "Could not create a writable mount point.\n\n"
+                           "Try running the following commands in terminal:\n"
+                           "sudo fusermount -u ~/iPhoneMount\n"
+                           "sudo rm -rf ~/iPhoneMount\n"
+                           "mkdir -p ~/iPhoneMount")
+        update_status("Status: Deep clean failed")
 
 def reset_mount_point_ui():
     """Reset the mount point directory with UI feedback"""
+    if mount_point_busy() or transfer_in_progress():
+        return
+    invalidate_mount_cache()
     if check_mount():
         if not messagebox.askyesno("Confirmation", "iPhone is currently mounted. Unmount and reset mount point?"):
             return
     
+    set_mount_point_busy("Mount point reset")
+    invalidate_listing_cache()
     update_status("Status: Resetting mount point...")
-    if reset_mount_point():
+    # Unmounting a wedged FUSE mount can take seconds, so keep it off the UI thread
+    run_in_background(reset_mount_point, _finish_reset_mount_point)
+
+def _finish_reset_mount_point(success, error):
+    """Report the result of reset_mount_point() (runs on the Tk main thread)"""
+    # Cleared before offering the deep clean, which marks the mount point busy again
+    set_mount_point_busy(None)
+    if success:
         messagebox.showinfo("Success", "Mount point has been reset successfully.\n\nTry mounting your iPhone again.")
         update_status("Status: Mount point reset complete")
     else:
@@ -1268,6 +2023,19 @@ def check_instance_running():
         debug_log("Another instance is already running")
         return True
 
+def _index_runs(indexes):
+    """Yield (first, last) for each run of consecutive values in sorted indexes"""
+    first = last = None
+    for i in indexes:
+        if last is not None and i == last + 1:
+            last = i
+            continue
+        if first is not None:
+            yield first, last
+        first = last = i
+    if first is not None:
+        yield first, last
+
 def search_files():
     """Search for files in the current list view"""
     if not check_mount():
@@ -1302,17 +2070,16 @@ def search_files():
         # Clear current selection
         file_list.selection_clear(0, END)
         
-        # Find matches
-        matches = 0
-        for i in range(file_list.size()):
-            item = file_list.get(i)
-            if search_term in item.lower():
-                file_list.selection_set(i)
-                if matches == 0:  # Ensure first match is visible
-                    file_list.see(i)
-                matches += 1
+        # Find matches, fetching all rows in one Tcl call
+        items = file_list.get(0, END)
+        match_indexes = [i for i, item in enumerate(items) if search_term in item.lower()]
+        # Select runs of adjacent matches with one Tcl call each
+        for first, last in _index_runs(match_indexes):
+            file_list.selection_set(first, last)
+        matches = len(match_indexes)
                 
         if matches > 0:
+            file_list.see(match_indexes[0])  # Ensure first match is visible
             result_label.config(text=f"Found {matches} matching files")
             search_window.focus_set()  # Return focus to search dialog
         else:
@@ -1437,12 +2204,17 @@ def main():
         
         # Set up UI and other components
         setup_ui(root)
+        root.after(UI_QUEUE_POLL_MS, drain_ui_queue)
         
-        # Check if the mount point is already mounted
+        # Check if the mount point is already mounted, and if so work out the
+        # mount type now with one mount table read so the listing doesn't
+        # have to probe again
         if check_mount():
-            debug_log("iPhone already mounted at startup")
+            is_documents_mount()
+            debug_log(f"iPhone already mounted at startup ({CURRENT_MOUNT_TYPE})")
             update_status("Status: iPhone already mounted")
-            root.after(500, list_files)  # Schedule listing files after UI is shown
+            # Schedule listing files after UI is shown
+            root.after(500, lambda: list_files(mounted=True))
         
         log_message(f"{APP_NAME} v{APP_VERSION} started successfully")
         root.mainloop()
@@ -1455,14 +2227,15 @@ def main():
 
 def setup_ui(root):
     """Set up the UI components"""
-    global top_frame, status_label, button_frame, extra_frame, list_frame, file_list, scrollbar, bottom_frame
+    global top_frame, status_label, status_var, button_frame, extra_frame, list_frame, file_list, file_list_var, scrollbar, list_note_label, bottom_frame
     
     # Top frame for title and status
     top_frame = Frame(root)
     top_frame.pack(fill="x", pady=5)
     
     Label(top_frame, text=f"📱 {APP_NAME}", font=("Helvetica", 14)).pack(side="left", padx=10)
-    status_label = Label(top_frame, text="Status: Not connected", fg="gray")
+    status_var = StringVar(value="Status: Not connected")
+    status_label = Label(top_frame, textvariable=status_var, fg="gray")
     status_label.pack(side="right", padx=10)
     
     # Button frame
@@ -1472,7 +2245,7 @@ def setup_ui(root):
     Button(button_frame, text="Mount Media", command=mount_iphone, width=15).pack(side="left", padx=5)
     Button(button_frame, text="Mount Documents", command=mount_iphone_documents, width=15).pack(side="left", padx=5)
     Button(button_frame, text="Unmount", command=unmount_iphone, width=10).pack(side="left", padx=5)
-    Button(button_frame, text="Refresh Files", command=list_files, width=10).pack(side="left", padx=5)
+    Button(button_frame, text="Refresh Files", command=refresh_files, width=10).pack(side="left", padx=5)
     
     # Extra button frame for utilities
     extra_frame = Frame(root)
@@ -1490,11 +2263,19 @@ def setup_ui(root):
     scrollbar = Scrollbar(list_frame)
     scrollbar.pack(side="right", fill="y")
     
-    # Use extended selection mode to allow multiple file selection
-    file_list = Listbox(list_frame, yscrollcommand=scrollbar.set, width=80, font=("Monospace", 10), selectmode="extended")
+    # Use extended selection mode to allow multiple file selection. The contents
+    # are driven through file_list_var so a whole batch is set in one Tcl call.
+    file_list_var = tk.Variable(value=())
+    file_list = Listbox(list_frame, listvariable=file_list_var, yscrollcommand=scrollbar.set, width=80,
+                        font=("Monospace", 10), selectmode="extended")
     file_list.pack(side="left", fill="both", expand=True)
     scrollbar.config(command=file_list.yview)
     
+    # Notes about the listing (documents folder, empty folder, display limit)
+    # live here so the Listbox only ever holds file paths
+    list_note_label = Label(root, text="", fg="gray", justify="left")
+    list_note_label.pack(fill="x", padx=10)
+    
     # Bottom button frame
     bottom_frame = Frame(root)
     bottom_frame.pack(pady=10)
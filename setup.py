@@ -2,13 +2,16 @@
 
 from setuptools import setup
 
+with open("README.md", encoding="utf-8") as f:
+    long_description = f.read()
+
 setup(
     name="plugnpass",
     version="1.0.0",
     author="adermgram",
     author_email="adamidrisadam004@gmail.com",
     description="iPhone File Transfer Utility for Linux",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/adermgram/plugnpass",
     py_modules=["iphone_file_transfer"],